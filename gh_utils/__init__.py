@@ -0,0 +1 @@
+"""Helpers for collecting and filtering JuliaLang/julia pull requests."""
@@ -0,0 +1,406 @@
+"""On-disk cache for GitHub PR payloads.
+
+Layout: one JSON file per PR (``<repo>/pr_<number>.json``) plus a per-repo
+``index.json`` holding lightweight metadata (title, ``updated_at``) for
+staleness checks and the PR-number lists of previously resolved tag ranges.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mmap
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from .jsonio import dumps, loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
+try:
+    import simdjson
+
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:  # pragma: no cover - pysimdjson is optional
+    simdjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "julia-compiler-tracker"
+
+# Below this index size a full parse is cheaper than ijson's streaming
+# setup, so the lazy path only kicks in for large archives.
+_STREAM_PARSE_THRESHOLD = 1 << 20
+
+# The GitHub API attaches hundreds of fields per PR (avatars, HTML URLs,
+# reactions, ...) that nothing downstream reads; disk, parse time, and
+# memory all scale with payload bytes, so cache only what is consumed.
+_PR_KEEP = {
+    "number",
+    "title",
+    "merged_at",
+    "mergedAt",
+    "updated_at",
+    "updatedAt",
+    "files",
+    "files_etag",
+    "labels",
+    "user",
+}
+_FILE_KEEP = {"filename", "additions", "deletions"}
+
+if zstandard is not None:
+    _PR_SUFFIX = ".json.zst"
+    _compress = zstandard.ZstdCompressor(level=3).compress
+    _decompress = zstandard.ZstdDecompressor().decompress
+else:
+    _PR_SUFFIX = ".json.gz"
+    _compress = gzip.compress
+    _decompress = gzip.decompress
+
+
+def _prune_pr(pr: dict[str, Any]) -> dict[str, Any]:
+    pruned = {k: v for k, v in pr.items() if k in _PR_KEEP}
+    files = pruned.get("files")
+    if files:
+        pruned["files"] = [
+            {k: v for k, v in f.items() if k in _FILE_KEEP} for f in files
+        ]
+    return pruned
+
+
+class PRCache:
+    """File-backed cache of PR payloads keyed by repo and PR number."""
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # repo -> (index.json st_mtime_ns, parsed index)
+        self._index_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+
+    def _repo_dir(self, repo: str) -> Path:
+        repo_dir = self.cache_dir / repo.replace("/", "_")
+        repo_dir.mkdir(parents=True, exist_ok=True)
+        return repo_dir
+
+    def _pr_file(self, repo: str, pr_number: int) -> Path:
+        return self._repo_dir(repo) / f"pr_{pr_number}{_PR_SUFFIX}"
+
+    def _index_file(self, repo: str) -> Path:
+        return self._repo_dir(repo) / "index.json"
+
+    @staticmethod
+    def _index_entry(pr: dict[str, Any]) -> dict[str, str]:
+        return {
+            "title": pr.get("title", ""),
+            "updated_at": pr.get("updated_at") or pr.get("updatedAt", ""),
+            "files_etag": pr.get("files_etag", ""),
+        }
+
+    def get_index(self, repo: str) -> dict[str, Any]:
+        index_file = self._index_file(repo)
+        try:
+            mtime = index_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {"prs": {}, "ranges": {}}
+        cached = self._index_cache.get(repo)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        index = self._read_index_file(index_file)
+        # The in-memory index is keyed by int PR number; JSON only has
+        # string keys, so convert once here instead of per lookup.
+        index["prs"] = {int(n): info for n, info in index.get("prs", {}).items()}
+        self._index_cache[repo] = (mtime, index)
+        return index
+
+    @staticmethod
+    def _read_index_file(index_file: Path) -> dict[str, Any]:
+        # simdjson parses memory-mapped bytes in place with SIMD, skipping
+        # the read/decode copy Path.read_bytes + a Python-level parser pay.
+        if simdjson is not None:
+            with open(index_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        return _SIMDJSON_PARSER.parse(mm).as_dict()
+                    finally:
+                        mm.close()
+        return loads(index_file.read_bytes())
+
+    def save_index(self, repo: str, index: dict[str, Any]) -> None:
+        index_file = self._index_file(repo)
+        index_file.write_bytes(dumps(index))
+        self._index_cache[repo] = (index_file.stat().st_mtime_ns, index)
+
+    def get_pr(self, repo: str, pr_number: int) -> dict[str, Any] | None:
+        cache_file = self._pr_file(repo, pr_number)
+        if cache_file.exists():
+            return loads(_decompress(cache_file.read_bytes()))
+        # Older cache layouts: gzip written before zstandard was installed,
+        # or uncompressed JSON from before compression existed.
+        base = self._repo_dir(repo) / f"pr_{pr_number}"
+        gz_file = base.with_suffix(".json.gz")
+        if _PR_SUFFIX != ".json.gz" and gz_file.exists():
+            return loads(gzip.decompress(gz_file.read_bytes()))
+        plain_file = base.with_suffix(".json")
+        if plain_file.exists():
+            return loads(plain_file.read_bytes())
+        return None
+
+    def save_pr(self, repo: str, pr: dict[str, Any], update_index: bool = True) -> None:
+        pr_number = pr["number"]
+        self._pr_file(repo, pr_number).write_bytes(_compress(dumps(_prune_pr(pr))))
+        if update_index:
+            index = self.get_index(repo)
+            index["prs"][pr_number] = self._index_entry(pr)
+            self.save_index(repo, index)
+
+    def save_prs_batch(self, repo: str, prs: list[dict[str, Any]]) -> None:
+        index = self.get_index(repo)
+        # Pre-serialize everything, then write with raw os calls: pathlib's
+        # write_bytes stats the path on every open, which adds up over
+        # thousands of small PR files.
+        writes: list[tuple[Path, bytes]] = []
+        for pr in prs:
+            writes.append(
+                (self._pr_file(repo, pr["number"]), _compress(dumps(_prune_pr(pr))))
+            )
+            index["prs"][pr["number"]] = self._index_entry(pr)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        for path, buf in writes:
+            fd = os.open(path, flags, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
+        self.save_index(repo, index)
+
+    def get_cached_pr_numbers(self, repo: str) -> set[int]:
+        return set(self.get_index(repo).get("prs", {}))
+
+    def get_cached_updated_at(self, repo: str, pr_number: int) -> str | None:
+        # For a large, not-yet-memoized index, pull just the one field
+        # instead of materializing the whole document for a single lookup:
+        # simdjson resolves a JSON pointer lazily over mmap'd bytes, and
+        # ijson streams the same path when simdjson is absent.
+        if (simdjson or ijson) is not None and repo not in self._index_cache:
+            index_file = self._index_file(repo)
+            try:
+                size = index_file.stat().st_size
+            except FileNotFoundError:
+                return None
+            if size > _STREAM_PARSE_THRESHOLD:
+                if simdjson is not None:
+                    with open(index_file, "rb") as f:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        try:
+                            doc = _SIMDJSON_PARSER.parse(mm)
+                            return doc.at_pointer(f"/prs/{pr_number}/updated_at")
+                        except (KeyError, ValueError):
+                            return None
+                        finally:
+                            mm.close()
+                with open(index_file, "rb") as f:
+                    for value in ijson.items(f, f"prs.{pr_number}.updated_at"):
+                        return value
+                return None
+        index = self.get_index(repo)
+        info = index.get("prs", {}).get(pr_number)
+        return info.get("updated_at") if info else None
+
+    def is_pr_stale(
+        self, repo: str, pr: dict[str, Any], index: dict[str, Any] | None = None
+    ) -> bool:
+        if index is None:
+            index = self.get_index(repo)
+        info = index.get("prs", {}).get(pr["number"])
+        if info is None:
+            return True
+        current = pr.get("updated_at") or pr.get("updatedAt", "")
+        return info.get("updated_at", "") < current
+
+    def find_stale_prs(self, repo: str, current_prs: list[dict[str, Any]]) -> list[int]:
+        # Single pass over a local dict instead of one is_pr_stale call
+        # (and its get/str/get chain) per PR.
+        cached = self.get_index(repo).get("prs", {})
+        return [
+            pr["number"]
+            for pr in current_prs
+            if (info := cached.get(pr["number"])) is None
+            or info.get("updated_at", "")
+            < (pr.get("updated_at") or pr.get("updatedAt", ""))
+        ]
+
+    def get_prs(self, repo: str, pr_numbers: list[int]) -> list[dict[str, Any] | None]:
+        return [self.get_pr(repo, n) for n in pr_numbers]
+
+    def get_files_etag(self, repo: str, pr_number: int) -> str | None:
+        info = self.get_index(repo).get("prs", {}).get(pr_number)
+        return (info.get("files_etag") or None) if info else None
+
+    def get_tag_range(self, repo: str, start_tag: str, end_tag: str) -> list[int] | None:
+        entry = self.get_index(repo).get("ranges", {}).get(f"{start_tag}..{end_tag}")
+        if isinstance(entry, dict):
+            return entry.get("pr_numbers")
+        return entry
+
+    def get_tag_range_etag(self, repo: str, start_tag: str, end_tag: str) -> str | None:
+        entry = self.get_index(repo).get("ranges", {}).get(f"{start_tag}..{end_tag}")
+        return entry.get("etag") if isinstance(entry, dict) else None
+
+    def save_tag_range(
+        self,
+        repo: str,
+        start_tag: str,
+        end_tag: str,
+        pr_numbers: list[int],
+        etag: str | None = None,
+    ) -> None:
+        index = self.get_index(repo)
+        index.setdefault("ranges", {})[f"{start_tag}..{end_tag}"] = {
+            "pr_numbers": pr_numbers,
+            "etag": etag or "",
+        }
+        self.save_index(repo, index)
+
+
+class SQLitePRCache:
+    """SQLite-backed drop-in for :class:`PRCache`.
+
+    Stores every PR payload as a serialized blob in a single database file,
+    so range reads are one ``SELECT`` instead of N file opens and batch
+    writes are one transaction instead of N file writes plus an index
+    rewrite.
+    """
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_dir / "prs.db")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS prs (
+                repo TEXT NOT NULL,
+                number INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                title TEXT NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (repo, number)
+            );
+            CREATE TABLE IF NOT EXISTS tag_ranges (
+                repo TEXT NOT NULL,
+                start_tag TEXT NOT NULL,
+                end_tag TEXT NOT NULL,
+                pr_numbers BLOB NOT NULL,
+                PRIMARY KEY (repo, start_tag, end_tag)
+            );
+            """
+        )
+
+    @staticmethod
+    def _row(repo: str, pr: dict[str, Any]) -> tuple[str, int, str, str, bytes]:
+        return (
+            repo,
+            pr["number"],
+            pr.get("updated_at") or pr.get("updatedAt", ""),
+            pr.get("title", ""),
+            dumps(_prune_pr(pr)),
+        )
+
+    def get_pr(self, repo: str, pr_number: int) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT data FROM prs WHERE repo = ? AND number = ?", (repo, pr_number)
+        ).fetchone()
+        return loads(row[0]) if row else None
+
+    def save_pr(self, repo: str, pr: dict[str, Any]) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prs VALUES (?, ?, ?, ?, ?)",
+                self._row(repo, pr),
+            )
+
+    def save_prs_batch(self, repo: str, prs: list[dict[str, Any]]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO prs VALUES (?, ?, ?, ?, ?)",
+                [self._row(repo, pr) for pr in prs],
+            )
+
+    def get_cached_pr_numbers(self, repo: str) -> set[int]:
+        rows = self._conn.execute(
+            "SELECT number FROM prs WHERE repo = ?", (repo,)
+        ).fetchall()
+        return {number for (number,) in rows}
+
+    def get_cached_updated_at(self, repo: str, pr_number: int) -> str | None:
+        row = self._conn.execute(
+            "SELECT updated_at FROM prs WHERE repo = ? AND number = ?",
+            (repo, pr_number),
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_pr_stale(self, repo: str, pr: dict[str, Any]) -> bool:
+        cached = self.get_cached_updated_at(repo, pr["number"])
+        if cached is None:
+            return True
+        current = pr.get("updated_at") or pr.get("updatedAt", "")
+        return cached < current
+
+    def find_stale_prs(self, repo: str, current_prs: list[dict[str, Any]]) -> list[int]:
+        return [pr["number"] for pr in current_prs if self.is_pr_stale(repo, pr)]
+
+    def get_prs(self, repo: str, pr_numbers: list[int]) -> list[dict[str, Any] | None]:
+        placeholders = ",".join("?" * len(pr_numbers))
+        rows = self._conn.execute(
+            f"SELECT number, data FROM prs WHERE repo = ? AND number IN ({placeholders})",
+            (repo, *pr_numbers),
+        ).fetchall()
+        by_number = {number: loads(data) for number, data in rows}
+        return [by_number.get(n) for n in pr_numbers]
+
+    def get_files_etag(self, repo: str, pr_number: int) -> str | None:
+        pr = self.get_pr(repo, pr_number)
+        return pr.get("files_etag") or None if pr else None
+
+    def _tag_range_entry(
+        self, repo: str, start_tag: str, end_tag: str
+    ) -> dict[str, Any] | list[int] | None:
+        row = self._conn.execute(
+            "SELECT pr_numbers FROM tag_ranges"
+            " WHERE repo = ? AND start_tag = ? AND end_tag = ?",
+            (repo, start_tag, end_tag),
+        ).fetchone()
+        return loads(row[0]) if row else None
+
+    def get_tag_range(self, repo: str, start_tag: str, end_tag: str) -> list[int] | None:
+        entry = self._tag_range_entry(repo, start_tag, end_tag)
+        if isinstance(entry, dict):
+            return entry.get("pr_numbers")
+        return entry
+
+    def get_tag_range_etag(self, repo: str, start_tag: str, end_tag: str) -> str | None:
+        entry = self._tag_range_entry(repo, start_tag, end_tag)
+        return entry.get("etag") if isinstance(entry, dict) else None
+
+    def save_tag_range(
+        self,
+        repo: str,
+        start_tag: str,
+        end_tag: str,
+        pr_numbers: list[int],
+        etag: str | None = None,
+    ) -> None:
+        entry = {"pr_numbers": pr_numbers, "etag": etag or ""}
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tag_ranges VALUES (?, ?, ?, ?)",
+                (repo, start_tag, end_tag, dumps(entry)),
+            )
@@ -0,0 +1,216 @@
+"""Minimal GitHub REST client used by the PR collection scripts."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from functools import lru_cache
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is optional
+    httpx = None
+
+GITHUB_API = "https://api.github.com"
+REQUEST_TIMEOUT = 30
+
+# Sentinel returned by conditional GETs when the server answers 304: the
+# cached copy is current and no body was sent (304s also cost no rate-limit
+# quota).
+NOT_MODIFIED = object()
+
+# One pooled session for the whole process: paginated fetches issue
+# thousands of requests to the same host, and without keep-alive each one
+# would pay a fresh TCP+TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+
+class RateLimitError(RuntimeError):
+    """Raised when the GitHub API reports an exhausted rate limit."""
+
+
+@lru_cache(maxsize=4)
+def _headers_for(token: str | None) -> dict[str, str]:
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def get_headers() -> dict[str, str]:
+    return _headers_for(os.environ.get("GITHUB_TOKEN"))
+
+
+def _check_response(response: Any) -> None:
+    """Raise on rate-limit exhaustion or HTTP errors.
+
+    Works for both requests and httpx responses; each exposes
+    ``status_code``, ``headers``, and ``raise_for_status``.
+    """
+    if (
+        response.status_code == 403
+        and response.headers.get("X-RateLimit-Remaining") == "0"
+    ):
+        reset = response.headers.get("X-RateLimit-Reset", "unknown")
+        raise RateLimitError(f"GitHub rate limit exhausted; resets at {reset}")
+    response.raise_for_status()
+
+
+def api_get(endpoint: str, params: dict[str, Any] | None = None) -> Any:
+    url = endpoint if endpoint.startswith("http") else f"{GITHUB_API}{endpoint}"
+    response = _SESSION.get(
+        url, headers=get_headers(), params=params, timeout=REQUEST_TIMEOUT
+    )
+    _check_response(response)
+    return response.json()
+
+
+def api_get_conditional(
+    endpoint: str, params: dict[str, Any] | None = None, etag: str | None = None
+) -> tuple[Any, str | None]:
+    """GET with ``If-None-Match``; returns ``(data, etag)``.
+
+    ``data`` is :data:`NOT_MODIFIED` when the server answers 304; the etag
+    from the response is returned so callers can store it for next time.
+    """
+    url = endpoint if endpoint.startswith("http") else f"{GITHUB_API}{endpoint}"
+    headers = get_headers()
+    if etag:
+        headers = {**headers, "If-None-Match": etag}
+    response = _SESSION.get(
+        url, headers=headers, params=params, timeout=REQUEST_TIMEOUT
+    )
+    if etag and response.status_code == 304:
+        return NOT_MODIFIED, etag
+    _check_response(response)
+    return response.json(), response.headers.get("ETag")
+
+
+def get_pr_files_conditional(
+    pr_number: int, repo: str, etag: str | None = None
+) -> tuple[Any, str | None]:
+    """Fetch a PR's file list, short-circuiting on 304.
+
+    Returns ``(files, etag)``; ``files`` is :data:`NOT_MODIFIED` when the
+    cached copy is still current. The etag covers the first page, which is
+    sufficient: any file change also changes page 1.
+    """
+    endpoint = f"/repos/{repo}/pulls/{pr_number}/files"
+    data, new_etag = api_get_conditional(
+        endpoint, {"per_page": 100, "page": 1}, etag
+    )
+    if data is NOT_MODIFIED:
+        return NOT_MODIFIED, etag
+    files = list(data)
+    page = 1
+    while len(data) == 100 and page < 10:
+        page += 1
+        data = api_get(endpoint, {"per_page": 100, "page": page})
+        files.extend(data)
+    return files, new_etag
+
+
+def _last_page_number(response: Any) -> int:
+    """Extract the last page number from a Link header, defaulting to 1."""
+    last_url = response.links.get("last", {}).get("url")
+    if not last_url:
+        return 1
+    pages = parse_qs(urlparse(last_url).query).get("page")
+    return int(pages[0]) if pages else 1
+
+
+async def _gather_pages_async(
+    url: str, params: dict[str, Any], pages: range
+) -> list[Any]:
+    """Fetch the remaining pages of a paginated endpoint concurrently."""
+    limits = httpx.Limits(max_connections=16)
+    async with httpx.AsyncClient(
+        headers=get_headers(), limits=limits, timeout=REQUEST_TIMEOUT
+    ) as client:
+        responses = await asyncio.gather(
+            *[client.get(url, params={**params, "page": page}) for page in pages]
+        )
+    batches: list[Any] = []
+    for response in responses:
+        _check_response(response)
+        batches.append(response.json())
+    return batches
+
+
+def api_get_paginated(
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    max_pages: int = 10,
+    per_page: int = 100,
+) -> list[Any]:
+    """Fetch every page of a paginated endpoint.
+
+    Page 1 goes through the pooled session — the common case is a single
+    page, which should cost exactly one keep-alive request. Its ``Link:
+    rel="last"`` header gives the total page count; only when more pages
+    exist (and httpx is installed) is an async client spun up to fetch
+    the tail concurrently.
+    """
+    url = endpoint if endpoint.startswith("http") else f"{GITHUB_API}{endpoint}"
+    params = dict(params or {})
+    params["per_page"] = per_page
+    first = _SESSION.get(
+        url, headers=get_headers(), params={**params, "page": 1}, timeout=REQUEST_TIMEOUT
+    )
+    _check_response(first)
+    results: list[Any] = list(first.json())
+    last_page = min(_last_page_number(first), max_pages)
+    if last_page <= 1:
+        return results
+    tail = range(2, last_page + 1)
+    if httpx is not None:
+        for batch in asyncio.run(_gather_pages_async(url, params, tail)):
+            results.extend(batch)
+        return results
+    for page in tail:
+        results.extend(api_get(url, {**params, "page": page}))
+    return results
+
+
+def get_pr_files(pr_number: int, repo: str) -> list[dict[str, Any]]:
+    return api_get_paginated(f"/repos/{repo}/pulls/{pr_number}/files")
+
+
+def list_prs_between_dates(
+    repo: str, start_date: str, end_date: str, etag: str | None = None
+) -> tuple[Any, str | None]:
+    """Search merged PRs in ``[start_date, end_date]`` (ISO dates).
+
+    Returns ``(prs, etag)``; ``prs`` is :data:`NOT_MODIFIED` when a stored
+    ``etag`` was supplied and the search results have not changed.
+    """
+    query = f"repo:{repo} is:pr is:merged merged:{start_date}..{end_date}"
+    params = {"q": query, "per_page": 100, "page": 1}
+    data, new_etag = api_get_conditional("/search/issues", params, etag)
+    if data is NOT_MODIFIED:
+        return NOT_MODIFIED, etag
+    items = data.get("items", [])
+    prs: list[dict[str, Any]] = list(items)
+    page = 1
+    while len(items) == 100 and page < 10:
+        page += 1
+        data = api_get("/search/issues", {"q": query, "per_page": 100, "page": page})
+        items = data.get("items", [])
+        prs.extend(items)
+    return prs, new_etag
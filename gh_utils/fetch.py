@@ -0,0 +1,48 @@
+"""High-level fetch operations combining the API client with the cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .cache import PRCache, SQLitePRCache
+from .client import NOT_MODIFIED, api_get, list_prs_between_dates
+
+
+def get_tag_date(repo: str, tag: str) -> str:
+    """Return the ISO date of the commit a tag points at."""
+    commit = api_get(f"/repos/{repo}/commits/{tag}")
+    return commit["commit"]["committer"]["date"][:10]
+
+
+def fetch_prs_between_tags(
+    repo: str,
+    start_tag: str,
+    end_tag: str,
+    cache: PRCache | SQLitePRCache | None = None,
+    force_refresh: bool = False,
+) -> list[dict[str, Any]]:
+    """Return merged PRs between two tags, served from cache when possible.
+
+    A ``force_refresh`` revalidates the stored search ETag instead of
+    unconditionally re-downloading: a 304 costs no quota and no body, and
+    the cached PRs are served as-is.
+    """
+    cache = cache or PRCache()
+    pr_numbers = cache.get_tag_range(repo, start_tag, end_tag)
+    has_full_range = pr_numbers is not None
+    if has_full_range:
+        cached = cache.get_prs(repo, pr_numbers)
+        has_full_range = all(pr is not None for pr in cached)
+        if has_full_range and not force_refresh:
+            return cached
+    start_date = get_tag_date(repo, start_tag)
+    end_date = get_tag_date(repo, end_tag)
+    etag = cache.get_tag_range_etag(repo, start_tag, end_tag) if has_full_range else None
+    prs, new_etag = list_prs_between_dates(repo, start_date, end_date, etag)
+    if prs is NOT_MODIFIED:
+        return cached
+    cache.save_prs_batch(repo, prs)
+    cache.save_tag_range(
+        repo, start_tag, end_tag, [pr["number"] for pr in prs], etag=new_etag
+    )
+    return prs
@@ -0,0 +1,190 @@
+"""Identify compiler-relevant PRs by the files they touch.
+
+The path list mirrors the filtering guidance in
+``.agents/skills/compiler-changelog/SKILL.md``.
+"""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .cache import PRCache
+from .client import NOT_MODIFIED, get_pr_files_conditional
+
+MAX_FETCH_WORKERS = 8
+
+COMPILER_PATHS = [
+    # Compiler package (base/compiler/ before Julia 1.12)
+    "Compiler/src/",
+    "Compiler/test/",
+    "base/compiler/",
+    # LLVM codegen and JIT
+    "src/codegen.cpp",
+    "src/aotcompile.cpp",
+    "src/jitlayers.cpp",
+    "src/engine.cpp",
+    "src/pipeline.cpp",
+    "src/cgutils.cpp",
+    "src/cgmemmgr.cpp",
+    "src/ccall.cpp",
+    "src/intrinsics.cpp",
+    "src/intrinsics.h",
+    "src/debuginfo.cpp",
+    "src/disasm.cpp",
+    "src/llvm-",
+    # Type system and dispatch
+    "src/subtype.c",
+    "src/gf.c",
+    "src/typemap.c",
+    "src/datatype.c",
+    "src/method.c",
+    # Lowering and parsing
+    "src/flisp/",
+    "src/julia-syntax.scm",
+    "src/julia-parser.scm",
+    "src/macroexpand.scm",
+    "src/jlfrontend.scm",
+    "src/ast.c",
+    "JuliaSyntax/",
+    "JuliaLowering/",
+    # Runtime, GC, and interpreter
+    "src/gc-",
+    "src/interpreter.c",
+    "src/builtins.c",
+    "src/runtime_intrinsics.c",
+    "src/toplevel.c",
+    "src/module.c",
+    "src/opaque_closure.c",
+    "src/safepoint.c",
+    # Serialization and precompilation
+    "src/staticdata.c",
+    "src/staticdata_utils.c",
+    "src/ircode.c",
+    "src/precompile.c",
+    "src/precompile_utils.c",
+    # Base compiler-facing files
+    "base/boot.jl",
+    "base/essentials.jl",
+    "base/expr.jl",
+    "base/meta.jl",
+    "base/reflection.jl",
+    "base/coreir.jl",
+    "base/opaque_closure.jl",
+    "base/runtime_internals.jl",
+    "base/loading.jl",
+    # Tests that reveal semantic shifts
+    "test/compiler/",
+    "test/llvmpasses/",
+    "test/gc/",
+    "test/gcext/",
+    "test/subtype.jl",
+    "test/intrinsics.jl",
+    "test/opaque_closure.jl",
+    "test/precompile.jl",
+]
+
+
+# One compiled alternation scans all prefixes in a single pass; re.match
+# anchors at position 0, so this is a pure prefix test.
+_COMPILER_RE = re.compile("|".join(map(re.escape, COMPILER_PATHS)))
+
+
+def is_compiler_file(filename: str) -> bool:
+    return _COMPILER_RE.match(filename) is not None
+
+
+def is_compiler_pr(files: list[dict[str, Any]]) -> bool:
+    return any(is_compiler_file(f.get("filename", "")) for f in files)
+
+
+def fetch_pr_files_parallel(
+    pr_numbers: list[int],
+    repo: str,
+    max_workers: int = MAX_FETCH_WORKERS,
+    etags: dict[int, str] | None = None,
+) -> dict[int, tuple[Any, str | None]]:
+    """Fetch file lists for many PRs concurrently.
+
+    Each fetch is a blocking HTTP round-trip, so a small thread pool
+    overlaps them; ``RateLimitError`` from a worker propagates to the
+    caller. When ``etags`` are supplied the fetches are conditional and
+    unchanged PRs come back as ``NOT_MODIFIED``. Returns a mapping of PR
+    number to ``(files, etag)``.
+    """
+    if not pr_numbers:
+        return {}
+    etags = etags or {}
+    workers = min(max_workers, len(pr_numbers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda n: get_pr_files_conditional(n, repo, etags.get(n)), pr_numbers
+        )
+        return dict(zip(pr_numbers, results))
+
+
+def refresh_pr_files(
+    pr_numbers: list[int], repo: str, cache: PRCache | None = None
+) -> list[int]:
+    """Revalidate cached file lists, re-downloading only changed PRs.
+
+    Stored ETags make the fetches conditional: a 304 costs no rate-limit
+    quota and leaves the cached entry untouched. Returns the PR numbers
+    whose files actually changed.
+    """
+    cache = cache or PRCache()
+    etags = {
+        n: etag for n in pr_numbers if (etag := cache.get_files_etag(repo, n))
+    }
+    fetched = fetch_pr_files_parallel(pr_numbers, repo, etags=etags)
+    updated: list[dict[str, Any]] = []
+    for pr_number, (files, etag) in fetched.items():
+        if files is NOT_MODIFIED:
+            continue
+        pr = cache.get_pr(repo, pr_number) or {"number": pr_number}
+        pr["files"] = files
+        pr["files_etag"] = etag or ""
+        updated.append(pr)
+    if updated:
+        cache.save_prs_batch(repo, updated)
+    return [pr["number"] for pr in updated]
+
+
+def filter_compiler_prs(
+    prs: list[dict[str, Any]], repo: str, cache: PRCache | None = None
+) -> list[dict[str, Any]]:
+    """Return the subset of ``prs`` that touch compiler paths.
+
+    Missing file lists are fetched from the API concurrently and written
+    back so subsequent runs avoid the network entirely; cache writes stay
+    on the calling thread.
+    """
+    cache = cache or PRCache()
+    files_by_number: dict[int, list[dict[str, Any]]] = {}
+    missing: list[int] = []
+    for pr in prs:
+        pr_number = pr["number"]
+        cached = cache.get_pr(repo, pr_number)
+        files = (cached or {}).get("files")
+        if files is None:
+            missing.append(pr_number)
+        else:
+            files_by_number[pr_number] = files
+    fetched = fetch_pr_files_parallel(missing, repo)
+
+    updated: list[dict[str, Any]] = []
+    compiler_prs: list[dict[str, Any]] = []
+    for pr in prs:
+        pr_number = pr["number"]
+        if pr_number in fetched:
+            files, etag = fetched[pr_number]
+            pr = {**pr, "files": files, "files_etag": etag or ""}
+            updated.append(pr)
+        else:
+            files = files_by_number[pr_number]
+        if any(_COMPILER_RE.match(f.get("filename", "")) for f in files):
+            compiler_prs.append(pr)
+    if updated:
+        cache.save_prs_batch(repo, updated)
+    return compiler_prs
@@ -0,0 +1,39 @@
+"""JSON serialization helpers shared by the cache and scripts.
+
+Uses orjson when available — the cached GitHub payloads are large,
+dict-heavy documents where the stdlib's pure-Python encoder dominates
+the I/O cost — and falls back to the stdlib ``json`` module otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize ``obj`` to JSON bytes, optionally indented for humans.
+
+        Int dict keys (the PR index) are serialized as JSON strings, as
+        the stdlib does.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or a string."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - only hit when orjson is absent
+    import json
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize ``obj`` to JSON bytes, optionally indented for humans."""
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or a string."""
+        return json.loads(data)
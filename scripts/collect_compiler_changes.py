@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Collect compiler-relevant commits between two tags of a local Julia clone.
+
+Walks ``git log`` over the requested range, keeps commits touching compiler
+paths, and writes the result as JSON or CSV for changelog drafting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gh_utils.jsonio import dumps
+
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - pygit2 is optional
+    pygit2 = None
+
+COMPILER_PATHS = [
+    "Compiler/",
+    "base/compiler/",
+    "src/codegen.cpp",
+    "src/aotcompile.cpp",
+    "src/jitlayers.cpp",
+    "src/subtype.c",
+    "src/gf.c",
+]
+
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+PR_PATTERN = re.compile(r"\(#(\d+)\)\s*$")
+
+# One commit record as emitted by run_git_log: header fields separated by
+# \x1f, then the --name-only file list up to the next record separator.
+_RECORD_RE = re.compile(
+    "\x1e([0-9a-f]{40})\x1f([^\x1f]*)\x1f([^\x1f]*)\x1f([^\n\x1e]*)\n?([^\x1e]*)"
+)
+
+
+# slots=True drops the per-instance __dict__ (hundreds of bytes per record
+# on a 10k-commit run); records are built once and never mutated.
+@dataclass(slots=True, frozen=True)
+class CommitRecord:
+    sha: str
+    author: str
+    date: str
+    subject: str
+    pr_number: str
+    files: tuple[str, ...]
+
+
+def _git_log_cmd(repo: str, start_tag: str, end_tag: str) -> list[str]:
+    fmt = f"{RECORD_SEP}%H{FIELD_SEP}%an{FIELD_SEP}%as{FIELD_SEP}%s"
+    return [
+        "git",
+        "-C",
+        repo,
+        "log",
+        "--first-parent",
+        "--name-only",
+        f"--pretty=format:{fmt}",
+        f"{start_tag}..{end_tag}",
+    ]
+
+
+def iter_git_log(
+    repo: str, start_tag: str, end_tag: str, prefixes: tuple[str, ...] | None = None
+):
+    """Yield CommitRecords as git log produces them.
+
+    Reads the pipe in chunks and parses every complete record as soon as
+    its trailing separator arrives, so peak memory stays at one chunk plus
+    a partial record instead of the entire log, and the first record is
+    available after git's first flush. With ``prefixes``, commits touching
+    no matching path are skipped inside the parser.
+    """
+    cmd = _git_log_cmd(repo, start_tag, end_tag)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, bufsize=-1)
+    assert proc.stdout is not None
+    buffer = ""
+    try:
+        while chunk := proc.stdout.read(1 << 16):
+            buffer += chunk
+            # Records are only complete once the next separator arrives;
+            # keep the trailing partial record in the buffer.
+            cut = buffer.rfind(RECORD_SEP)
+            if cut > 0:
+                yield from _iter_records(buffer[:cut], prefixes)
+                buffer = buffer[cut:]
+        yield from _iter_records(buffer, prefixes)
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _iter_records(text: str, prefixes: tuple[str, ...] | None = None):
+    # A single finditer pass: the compiled record pattern scans the text
+    # in C, with no intermediate per-record split lists. The prefix check
+    # runs before the PR regex and record construction, so filtered-out
+    # commits (the vast majority on typical ranges) cost only the file
+    # split.
+    for match in _RECORD_RE.finditer(text):
+        sha, author, date, subject, file_block = match.groups()
+        files = tuple(line for line in file_block.splitlines() if line)
+        if prefixes and not any(f.startswith(prefixes) for f in files):
+            continue
+        pr_match = PR_PATTERN.search(subject)
+        yield CommitRecord(
+            sha=sha,
+            author=author,
+            date=date,
+            subject=subject,
+            pr_number=pr_match.group(1) if pr_match else "",
+            files=files,
+        )
+
+
+def parse_git_log(
+    raw: str, prefixes: tuple[str, ...] | None = None
+) -> list[CommitRecord]:
+    return list(_iter_records(raw, prefixes))
+
+
+def collect_with_pygit2(
+    repo_path: str,
+    start_tag: str,
+    end_tag: str,
+    prefixes: tuple[str, ...] | None = None,
+) -> list[CommitRecord]:
+    """Walk the commit range with libgit2 instead of shelling out.
+
+    Avoids piping the whole text log through a subprocess and re-parsing
+    it in Python: libgit2 walks commits and computes tree diffs in C.
+    """
+    repo = pygit2.Repository(repo_path)
+    end = repo.revparse_single(end_tag).peel(pygit2.Commit)
+    start = repo.revparse_single(start_tag).peel(pygit2.Commit)
+    # GIT_SORT_NONE is libgit2's default reverse-chronological order, the
+    # same ordering git log emits, so both collection paths agree.
+    walker = repo.walk(end.id, pygit2.GIT_SORT_NONE)
+    walker.hide(start.id)
+    walker.simplify_first_parent()
+    records = []
+    for commit in walker:
+        if commit.parents:
+            diff = repo.diff(commit.parents[0], commit)
+        else:
+            diff = commit.tree.diff_to_tree(swap=True)
+        files = tuple(delta.new_file.path for delta in diff.deltas)
+        if prefixes and not any(f.startswith(prefixes) for f in files):
+            continue
+        subject = commit.message.split("\n", 1)[0]
+        match = PR_PATTERN.search(subject)
+        # Render the date in the author's recorded timezone, matching the
+        # %as format the git log path emits.
+        author_tz = timezone(timedelta(minutes=commit.author.offset))
+        date = (
+            datetime.fromtimestamp(commit.author.time, tz=author_tz)
+            .date()
+            .isoformat()
+        )
+        records.append(
+            CommitRecord(
+                sha=str(commit.id),
+                author=commit.author.name,
+                date=date,
+                subject=subject,
+                pr_number=match.group(1) if match else "",
+                files=files,
+            )
+        )
+    return records
+
+
+def write_json(records: list[CommitRecord], output_path: str) -> None:
+    Path(output_path).write_bytes(
+        dumps([asdict(record) for record in records], indent=True)
+    )
+
+
+def write_csv(records: list[CommitRecord], output_path: str) -> None:
+    # Render the whole table into one in-memory buffer and issue a single
+    # write; csv.writer keeps the quoting rules that hand-formatted rows
+    # would get wrong on subjects containing commas.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["sha", "author", "date", "subject", "pr_number", "files"])
+    writer.writerows(
+        (r.sha, r.author, r.date, r.subject, r.pr_number, ";".join(r.files))
+        for r in records
+    )
+    Path(output_path).write_bytes(buffer.getvalue().encode("utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repo", required=True, help="path to a local julia clone")
+    parser.add_argument("--start-tag", required=True)
+    parser.add_argument("--end-tag", required=True)
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        help="compiler path prefix (repeatable; defaults to the built-in list)",
+    )
+    parser.add_argument("--output", default="compiler_changes.json")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    args = parser.parse_args()
+
+    prefixes = tuple(args.paths or COMPILER_PATHS)
+    if pygit2 is not None:
+        compiler_records = collect_with_pygit2(
+            args.repo, args.start_tag, args.end_tag, prefixes
+        )
+    else:
+        compiler_records = list(
+            iter_git_log(args.repo, args.start_tag, args.end_tag, prefixes)
+        )
+
+    if args.format == "csv":
+        write_csv(compiler_records, args.output)
+    else:
+        write_json(compiler_records, args.output)
+    print(f"{len(compiler_records)} commits touch compiler paths; wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
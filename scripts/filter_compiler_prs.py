@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Filter the cached PR archive down to compiler-relevant PRs.
+
+Fetches missing file lists from the GitHub API, then writes a summary JSON
+keyed by PR number for changelog drafting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gh_utils.cache import PRCache
+from gh_utils.filter import fetch_pr_files_parallel, is_compiler_pr, refresh_pr_files
+from gh_utils.jsonio import dumps
+
+REPO = "JuliaLang/julia"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output", default="compiler_prs.json", help="output JSON path"
+    )
+    parser.add_argument("--cache-dir", default=None, help="override cache directory")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="revalidate cached file lists via ETags (304s are free)",
+    )
+    args = parser.parse_args()
+
+    cache = PRCache(args.cache_dir) if args.cache_dir else PRCache()
+    index = cache.get_index(REPO)
+    pr_numbers = list(index.get("prs", {}).keys())
+
+    missing_files = [
+        n for n in pr_numbers if not (cache.get_pr(REPO, n) or {}).get("files")
+    ]
+    if args.refresh:
+        changed = refresh_pr_files(
+            [n for n in pr_numbers if n not in set(missing_files)], REPO, cache
+        )
+        print(f"refreshed file lists for {len(changed)} changed PRs")
+    fetched = fetch_pr_files_parallel(missing_files, REPO)
+    updated = []
+    for pr_num, (files, etag) in fetched.items():
+        pr = cache.get_pr(REPO, pr_num) or {"number": pr_num}
+        pr["files"] = files
+        pr["files_etag"] = etag or ""
+        updated.append(pr)
+    if updated:
+        cache.save_prs_batch(REPO, updated)
+
+    compiler_prs = []
+    for pr_num in pr_numbers:
+        pr = cache.get_pr(REPO, pr_num)
+        if pr and is_compiler_pr(pr.get("files", [])):
+            compiler_prs.append(
+                {
+                    "number": pr_num,
+                    "title": pr.get("title", ""),
+                    "files": [f.get("filename", "") for f in pr.get("files", [])],
+                }
+            )
+
+    result = {
+        "repo": REPO,
+        "count": len(compiler_prs),
+        "prs": {pr["number"]: pr for pr in compiler_prs},
+    }
+    output_file = Path(args.output)
+    output_file.write_bytes(dumps(result, indent=True))
+    print(f"wrote {len(compiler_prs)} compiler PRs to {output_file}")
+
+
+if __name__ == "__main__":
+    main()